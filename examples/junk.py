@@ -139,7 +139,6 @@ def example_3():
 
     df = pd.DataFrame(
         {
-            "days_since": [0, 1, 2, 3, 4, 5, 6],
             "weekday": ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"],
             "spend___facebook": [1000.1, 2000.2, 3000.3, 4000.4, 5000.5, 6000.6, 7000.7],
             "spend___google": [1000.1, 2000.2, 3000.3, 4000.4, 5000.5, 6000.6, 7000.7],
@@ -147,11 +146,10 @@ def example_3():
             "clicks___google": [100, 200, 300, 400, 500, 600, 700],
             "impressions___facebook": [100, 200, 300, 400, 500, 600, 700],
             "impressions___google": [100, 200, 300, 400, 500, 600, 700],
-        }
+        },
+        index=pd.RangeIndex(7, name="days_since"),
     )
 
-    df = df.set_index("days_since")
-
     @check_schemas
     def my_func(df: DataFrame[PlatformPerformanceData]) -> DataFrame[PlatformPerformanceData]:
         return df
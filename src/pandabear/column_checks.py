@@ -1,7 +1,27 @@
-from typing import Any, Iterable
+import dataclasses
+import re
+from functools import lru_cache
+from typing import Any, Callable, Iterable
 
+import numpy as np
 import pandas as pd
 
+REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+ISIN_UNROLL_LIMIT = 8
+ISIN_UNROLL_DTYPES = (np.dtype(np.int64), np.dtype(np.float64))
+ALL_BLOCK_SIZE = 1 << 16
+
+
+def is_literal_pattern(pattern: str) -> bool:
+    """Check whether a regex pattern contains no regex metacharacters."""
+    return REGEX_METACHARACTERS.isdisjoint(pattern)
+
+
+@lru_cache(maxsize=512)
+def compile_regex(pattern: str) -> re.Pattern:
+    """Compile `pattern` once and reuse it across checks and validations."""
+    return re.compile(pattern)
+
 
 def series_greater_equal(series: pd.Series, value: Any) -> pd.Series:
     return series >= value
@@ -19,15 +39,64 @@ def series_less(series: pd.Series, value: Any) -> pd.Series:
     return series < value
 
 
+def _small_numeric_set(value: Iterable) -> tuple | None:
+    """Get the members of `value` if it is a small collection of plain numbers.
+
+    NaN and booleans are excluded, since `isin` matches them differently than
+    `==` does.
+    """
+    if not isinstance(value, (list, tuple, set, frozenset)) or not 0 < len(value) <= ISIN_UNROLL_LIMIT:
+        return None
+    for member in value:
+        if isinstance(member, (bool, np.bool_)) or not isinstance(member, (int, float, np.number)) or member != member:
+            return None
+    return tuple(value)
+
+
+def _as_mask_of(series: pd.Series, mask: np.ndarray) -> pd.Series:
+    """Wrap a boolean ndarray like pandas wraps a mask computed on `series`.
+
+    A Series gets a Series aligned on its index, without copying `mask`. An
+    Index, whose own `isin` returns an ndarray, gets the ndarray as is.
+    """
+    if isinstance(series, pd.Series):
+        return pd.Series(mask, index=series.index, name=series.name, copy=False)
+    return mask
+
+
 def series_isin(series: pd.Series, value: Iterable) -> pd.Series:
-    return series.isin(value)
+    # For a handful of numbers, OR-ing vectorised comparisons is much faster
+    # than having `isin` build a hash table of `value` on every call.
+    # Only for int64/float64: on narrower dtypes numpy casts the members down
+    # to the series dtype, so e.g. float32 1.1 would equal 1.1, unlike `isin`.
+    members = _small_numeric_set(value)
+    if members is None or series.dtype not in ISIN_UNROLL_DTYPES:
+        return series.isin(value)
+    values = series.to_numpy()
+    mask = values == members[0]
+    for member in members[1:]:
+        mask |= values == member
+    return _as_mask_of(series, mask)
 
 
 def series_notin(series: pd.Series, value: Iterable) -> pd.Series:
-    return ~series.isin(value)
+    # Invert the fresh `isin` mask in place rather than allocating a second
+    # one. Nullable masks and read-only views (e.g. under copy-on-write) are
+    # inverted into a new mask instead.
+    isin = series_isin(series, value)
+    mask = np.asarray(isin)
+    if mask.dtype != np.bool_ or not mask.flags.writeable:
+        return ~isin
+    np.logical_not(mask, out=mask)
+    return isin
 
 
 def series_str_contains(series: pd.Series, value: str) -> pd.Series:
+    # Literal patterns are plain substring searches, no regex engine needed
+    if is_literal_pattern(value):
+        return series.str.contains(value, regex=False)
+    # Pass the pattern as a string: Arrow-backed strings don't accept a
+    # compiled pattern, and the object path compiles through `re`'s cache
     return series.str.contains(value)
 
 
@@ -49,16 +118,139 @@ def series_unique(series: pd.Series, value: bool = True) -> pd.Series:
     return ~series.duplicated(keep="first")
 
 
-CHECK_NAME_FUNCTION_MAP = {
-    "ge": series_greater_equal,
-    "gt": series_greater,
-    "le": series_less_equal,
-    "lt": series_less,
-    "isin": series_isin,
-    "notin": series_notin,
-    "str_contains": series_str_contains,
-    "str_startswith": series_str_startswith,
-    "str_endswith": series_str_endswith,
-    "nullable": series_nullable,
-    "unique": series_unique,
-}
+def _numeric_values(series: pd.Series, value: Any) -> np.ndarray | pd.api.extensions.ExtensionArray | None:
+    """Get the raw array of a numeric series, if `value` is a number.
+
+    For numpy-backed series this is the ndarray itself. For Arrow-backed
+    series it is the `ArrowExtensionArray`, whose comparisons and `all`
+    reduction run as `pyarrow.compute` kernels. A dataframe whose columns
+    share one numpy numeric dtype gives a 2-D ndarray, so that all of its
+    columns are compared in a single operation.
+    """
+    if not isinstance(value, (int, float, np.number)):
+        return None
+    if isinstance(series, pd.DataFrame):
+        dtypes = set(series.dtypes)
+        if len(dtypes) != 1:
+            return None
+        (dtype,) = dtypes
+        return series.to_numpy() if isinstance(dtype, np.dtype) and dtype.kind in "iuf" else None
+    dtype = series.dtype
+    if isinstance(dtype, np.dtype) and dtype.kind in "iuf":
+        return series.to_numpy()
+    if isinstance(dtype, pd.ArrowDtype) and dtype.kind in "iuf":
+        return series.array
+    return None
+
+
+def _all_compare(values: np.ndarray | pd.api.extensions.ExtensionArray, compare: np.ufunc, value: Any) -> bool:
+    """Check whether `compare(values, value)` holds for every element.
+
+    Large contiguous ndarrays are compared block by block into one reused
+    buffer, stopping at the first block with a failure. This avoids
+    allocating a mask as large as the column, and returns early when the
+    check fails.
+    """
+    if (
+        not isinstance(values, np.ndarray)
+        or values.size <= ALL_BLOCK_SIZE
+        or not (values.flags.c_contiguous or values.flags.f_contiguous)
+    ):
+        return bool(compare(values, value).all())
+    # A view in memory order, for 2-D frames as well as 1-D series
+    flat = values.ravel(order="K")
+    buffer = np.empty(ALL_BLOCK_SIZE, dtype=bool)
+    for start in range(0, flat.size, ALL_BLOCK_SIZE):
+        block = flat[start : start + ALL_BLOCK_SIZE]
+        out = buffer[: block.size]
+        compare(block, value, out=out)
+        if not out.all():
+            return False
+    return True
+
+
+def series_all_greater_equal(series: pd.Series, value: Any) -> bool:
+    values = _numeric_values(series, value)
+    return values is not None and _all_compare(values, np.greater_equal, value)
+
+
+def series_all_greater(series: pd.Series, value: Any) -> bool:
+    values = _numeric_values(series, value)
+    return values is not None and _all_compare(values, np.greater, value)
+
+
+def series_all_less_equal(series: pd.Series, value: Any) -> bool:
+    values = _numeric_values(series, value)
+    return values is not None and _all_compare(values, np.less_equal, value)
+
+
+def series_all_less(series: pd.Series, value: Any) -> bool:
+    values = _numeric_values(series, value)
+    return values is not None and _all_compare(values, np.less, value)
+
+
+def series_all_nullable(series: pd.Series, value: bool) -> bool:
+    return value or not series.hasnans
+
+
+def series_all_unique(series: pd.Series, value: bool = True) -> bool:
+    # `is_unique` is answered by a C-level hashtable (cached on indexes), so
+    # the full `duplicated` mask is only built when there are duplicates.
+    return series.is_unique
+
+
+def mask_all(result: pd.Series | pd.Index | np.ndarray) -> bool:
+    """Check whether a check mask is True for every row.
+
+    Plain boolean masks are reduced on their ndarray, skipping the pandas
+    reduction machinery. Nullable boolean masks keep pandas' `all`, which
+    skips NA.
+    """
+    if isinstance(result, np.ndarray):
+        return bool(result.all())
+    if result.dtype == np.bool_:
+        return bool(result.to_numpy().all())
+    return bool(result.all())
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class Check:
+    """A check that can be configured on a `Field`.
+
+    Args:
+        name: The `Field` attribute that holds the value of the check.
+        func: Function returning a boolean mask of the rows that pass.
+        all_func: Optional shortcut telling whether a whole series passes
+            without building the mask. A False result means the series either
+            fails or could not be decided cheaply (e.g. numeric checks on object
+            or nullable dtypes), in which case `func` is used to find the
+            failing rows.
+        cost: Relative cost of running the check. Checks on a field run from
+            cheapest to most expensive, so a failing cheap check raises before
+            an expensive one has to run.
+        accepts_frame: Whether `all_func` also accepts a dataframe, deciding
+            for all of its columns at once.
+    """
+
+    name: str
+    func: Callable[[pd.Series, Any], pd.Series]
+    all_func: Callable[[pd.Series, Any], bool] | None = None
+    cost: int = 0
+    accepts_frame: bool = False
+
+
+CHECKS = (
+    Check("ge", series_greater_equal, series_all_greater_equal, cost=2, accepts_frame=True),
+    Check("gt", series_greater, series_all_greater, cost=2, accepts_frame=True),
+    Check("le", series_less_equal, series_all_less_equal, cost=2, accepts_frame=True),
+    Check("lt", series_less, series_all_less, cost=2, accepts_frame=True),
+    Check("isin", series_isin, cost=3),
+    Check("notin", series_notin, cost=3),
+    Check("str_contains", series_str_contains, cost=5),
+    Check("str_startswith", series_str_startswith, cost=4),
+    Check("str_endswith", series_str_endswith, cost=4),
+    Check("nullable", series_nullable, series_all_nullable, cost=1),
+    Check("unique", series_unique, series_all_unique, cost=6),
+)
+
+CHECK_NAME_FUNCTION_MAP = {check.name: check.func for check in CHECKS}
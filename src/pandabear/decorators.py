@@ -12,53 +12,77 @@ P = ParamSpec("P")
 R = TypeVar("R")
 
 
-def _validate_variable_against_type_hint(var: Any, type_hint: Any, name: str) -> Any:
-    """Validate a variable against a type hint.
+def _unchanged(var: Any) -> Any:
+    """Validator for type hints that don't involve a `DataFrameModel`."""
+    return var
+
+
+def _compile_type_hint_validator(type_hint: Any, name: str) -> Callable[[Any], Any]:
+    """Build a validator for variables annotated with a type hint.
 
     This function is used by the `check_schemas` decorator to validate
-    input arguments and return values of a function.
+    input arguments and return values of a function. The shape of the type
+    hint is resolved once, when the function is decorated, so the returned
+    validator only has to check the variable itself.
 
     Args:
-        var (Any): The variable to validate.
         type_hint (Any): The type hint to validate against.
+        name (str): The name of the argument, or "return value".
+
+    Returns:
+        Callable[[Any], Any]: A function that takes the variable, and returns
+            it validated (and possibly coerced) against the type hint.
 
     Raises:
-        TypeError: If the variable does not match the type hint.
+        TypeError: If the variable does not match the type hint (raised by the
+            returned validator).
     """
+    location = f"argument `{name}`" if name != "return value" else name
+    type_args = get_args(type_hint)
+
     # type hint like: `pd.DataFrame | MySchema`
     if (
-        isinstance(type_hint, UnionType)
-        and len(get_args(type_hint)) == 2
-        and issubclass(get_args(type_hint)[1], BaseModel)
+        type(type_hint) is UnionType
+        and len(type_args) == 2
+        and isinstance(type_args[1], type)
+        and issubclass(type_args[1], BaseModel)
     ):
-        if not type(var) in [pd.DataFrame, pd.Series]:
-            expected_type = get_args(type_hint)[0].__name__
-            expected_schema = type_hint.__args__[1].__name__
-            raise TypeHintError(
-                f"Expected `{expected_type}[{expected_schema}]` in {f'argument `{name}`' if name != 'return value' else name}, but found {type(var)}"
-            )
-        schema = get_args(type_hint)[1]
-        transformed_var = schema.validate(var)
+        expected = f"{type_args[0].__name__}[{type_args[1].__name__}]"
+        schema_validate = type_args[1].validate
+
+        def validate_schema(var: Any) -> Any:
+            var_type = type(var)
+            if var_type is not pd.DataFrame and var_type is not pd.Series:
+                raise TypeHintError(f"Expected `{expected}` in {location}, but found {var_type}")
+            return schema_validate(var)
+
+        return validate_schema
 
     # type hint like: `tuple[int, pd.DataFrame | MySchema]` (or deeper nesting)
-    elif (len(return_types := get_args(type_hint))) > 1:
-        if type(var) not in [list, tuple]:
-            raise TypeHintError(
-                f"Expected a `tuple` or `list` in {f'argument `{name}`' if name != 'return value' else name}, but found {type(var)}"
-            )
-        elif len(var) != len(return_types):
-            raise TypeHintError(
-                f"Expected iterable of {len(return_types)} items in {f'argument `{name}`' if name != 'return value' else name}, but found {len(var)}"
-            )
-        transformed_var = ()
-        for var_i, type_hint_i in zip(var, return_types):
-            transformed_var += (_validate_variable_against_type_hint(var_i, type_hint_i, name),)
+    elif len(type_args) > 1:
+        item_validators = [_compile_type_hint_validator(type_hint_i, name) for type_hint_i in type_args]
+        # Only the items whose type hints involve a schema need validating
+        checked_items = [(i, validate) for i, validate in enumerate(item_validators) if validate is not _unchanged]
+        if not checked_items:
+            return _unchanged
+
+        def validate_items(var: Any) -> tuple:
+            var_type = type(var)
+            if var_type is not list and var_type is not tuple:
+                raise TypeHintError(f"Expected a `tuple` or `list` in {location}, but found {var_type}")
+            elif len(var) != len(item_validators):
+                raise TypeHintError(
+                    f"Expected iterable of {len(item_validators)} items in {location}, but found {len(var)}"
+                )
+            validated = list(var)
+            for i, validate in checked_items:
+                validated[i] = validate(var[i])
+            return tuple(validated)
+
+        return validate_items
 
     # type hint is not a `DataFrameModel` subclass
-    else:
-        transformed_var = var
-
-    return transformed_var
+    return _unchanged
 
 
 def check_schemas(func: Callable[P, R]) -> Callable[P, R]:
@@ -94,29 +118,71 @@ def check_schemas(func: Callable[P, R]) -> Callable[P, R]:
         TypeError: Expected a pandas dataframe or series, but found <class 'str'>. Check that your type hints and returned values match.
     """
 
+    # Annotations are fixed once `func` is defined, so turn them into
+    # validators here rather than inspecting them on every call
+    sig = inspect.signature(func)
+    validators = [
+        (name, _compile_type_hint_validator(parameter.annotation, name)) for name, parameter in sig.parameters.items()
+    ]
+    return_validator = _compile_type_hint_validator(sig.return_annotation, "return value")
+
+    # Nothing to validate, so there is no need to wrap `func` at all
+    if return_validator is _unchanged and all(validate is _unchanged for _, validate in validators):
+        return func
+
+    # When every parameter can be passed by position or keyword, arguments
+    # are matched to their validators by hand, which is much cheaper than
+    # `Signature.bind`. Defaults are validated too, as `bind` would do.
+    parameters = list(sig.parameters.values())
+    if all(parameter.kind is inspect.Parameter.POSITIONAL_OR_KEYWORD for parameter in parameters):
+        positional_validators = [
+            (position, name, parameter.default, validate)
+            for position, (parameter, (name, validate)) in enumerate(zip(parameters, validators))
+            if validate is not _unchanged
+        ]
+
+        @wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            # Validate input argument(s). The arguments are only copied when
+            # some of them are validated, and so may be replaced.
+            if positional_validators:
+                args = list(args)
+            for position, name, default, validate in positional_validators:
+                if position < len(args):
+                    args[position] = validate(args[position])
+                elif name in kwargs:
+                    kwargs[name] = validate(kwargs[name])
+                elif default is not inspect.Parameter.empty:
+                    kwargs[name] = validate(default)
+
+            # Execute the function
+            result = func(*args, **kwargs)
+
+            # Validate return value(s), unless no return type hint involves a schema
+            if return_validator is _unchanged:
+                return result
+            return return_validator(result)
+
+        return wrapper
+
+    validators = [(name, validate) for name, validate in validators if validate is not _unchanged]
+
     @wraps(func)
     def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
         # Validate input argument(s)
-        sig = inspect.signature(func)
         bound_args = sig.bind(*args, **kwargs)
         bound_args.apply_defaults()
 
-        for name, variable in bound_args.arguments.items():
-            type_hint = sig.parameters[name].annotation
-            bound_args.arguments[name] = _validate_variable_against_type_hint(variable, type_hint, name)
-
-        # Extract `args` and `kwargs` from bound arguments
-        args = bound_args.arguments.pop("args", {})
-        kwargs = bound_args.arguments.pop("kwargs", {})
+        for name, validate in validators:
+            bound_args.arguments[name] = validate(bound_args.arguments[name])
 
         # Execute the function
-        # result = func(*args, **kwargs)
-        result = func(*bound_args.arguments.values(), *args, **kwargs)
+        result = func(*bound_args.args, **bound_args.kwargs)
 
-        # Validate return value(s)
-        result = _validate_variable_against_type_hint(result, sig.return_annotation, "return value")
-
-        return result
+        # Validate return value(s), unless no return type hint involves a schema
+        if return_validator is _unchanged:
+            return result
+        return return_validator(result)
 
     return wrapper
 
@@ -157,12 +223,12 @@ def check(column_names: str | list[str]) -> Callable:
     if not isinstance(column_names, (str, list)):
         raise TypeError(f"Expected `str` or `list[str]`, but found {type(column_names)}")
 
-    column_names = [column_names] if type(column_names) == str else column_names
+    column_names = (column_names,) if isinstance(column_names, str) else tuple(column_names)
 
     def decorator(method: Callable) -> Callable:
         # Annotate method with check information. This allows the `validate`
         # method to find check functions and apply them to the correct columns.
-        method.__setattr__("__check__", column_names)
+        method.__check__ = column_names
         return method
 
     return decorator
@@ -190,12 +256,7 @@ def dataframe_check(method: Callable) -> Callable:
         >>>     def check_dataframe(df: pd.DataFrame) -> bool:
         >>>         return df.sum().sum() > 0
     """
-
-    def wrapper(df: pd.DataFrame) -> bool:
-        return method(df)
-
     # Annotate method with check information. This allows the `validate`
-    # method to find check functions and apply them to the correct columns.
-    wrapper.__check__ = None
-
-    return wrapper
+    # method to find check functions and apply them to the whole dataframe.
+    method.__check__ = None
+    return method
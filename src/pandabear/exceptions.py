@@ -1,11 +1,23 @@
-import re
+from functools import cached_property
 from typing import Any, Type
 
+import numpy as np
 import pandas as pd
 
 MAX_FAILURE_ROWS = 10
 
 
+def failed_mask(result: pd.Series | pd.Index | np.ndarray) -> np.ndarray:
+    """Invert a check result into a plain boolean array of failed rows.
+
+    Missing values in a nullable boolean result count as passing, like they
+    do in the `all` reduction that decided the check failed.
+    """
+    if isinstance(result, np.ndarray):
+        return ~result.astype(bool, copy=False)
+    return ~result.to_numpy(dtype=bool, na_value=True)
+
+
 class MissingColumnsError(Exception):
     """Raise when `df` is missing columns defined in `schema`.
 
@@ -14,7 +26,7 @@ class MissingColumnsError(Exception):
 
     def __init__(self, message):
         # strip trailing "." and " " from message
-        message = re.sub(r"[. ]+$", "", message)
+        message = message.rstrip(". ")
         suggestion = ". Is there a typo in the schema definition? If not, the dataframe is missing columns."
         super().__init__(message + suggestion)
 
@@ -27,7 +39,7 @@ class MissingIndexError(Exception):
 
     def __init__(self, message):
         # strip trailing "." and " " from message
-        message = re.sub(r"[. ]+$", "", message)
+        message = message.rstrip(". ")
         suggestion = ". Is there a typo in the schema definition? If not, the dataframe is missing index levels."
         super().__init__(message + suggestion)
 
@@ -100,19 +112,40 @@ class ColumnCheckError(Exception):
         self.check_value = check_value
         self.series = series
         self.result = result
-        super().__init__(self._get_message())
+        super().__init__(check_name, check_value)
+
+    def __str__(self) -> str:
+        # Built on demand, so errors that are caught and never printed don't
+        # pay for selecting and formatting the failing rows.
+        return self.message
+
+    @cached_property
+    def message(self) -> str:
+        """The formatted error message, built on first access."""
+        return self._get_message()
+
+    @cached_property
+    def failed(self) -> np.ndarray:
+        """Boolean array that is True for the rows that failed the check."""
+        return failed_mask(self.result)
+
+    @cached_property
+    def fail_series(self) -> pd.Series:
+        """The rows of the series that failed the check."""
+        return self.series[self.failed]
 
     def _get_message(self) -> str:
-        fail_series = self.series[~self.result]
-        total = len(self.series)
-        fails = len(fail_series)
+        # Only the displayed rows are selected, not every failing row
+        head_positions = np.flatnonzero(self.failed)[:MAX_FAILURE_ROWS]
+        total = len(self.failed)
+        fails = int(np.count_nonzero(self.failed))
         fail_pc = int(round(100 * fails / total))
         check_name = self.check_name.replace("series_", "")
         text_msg = (
             f"Column '{self.series.name}' failed check {check_name}({self.check_value}): "
             f"{fails} of {total} ({fail_pc} %)"
         )
-        fails_msg = fail_series.head(MAX_FAILURE_ROWS).to_string()
+        fails_msg = self.series.iloc[head_positions].to_string()
         return f"{text_msg}\n{fails_msg}"
 
 
@@ -126,19 +159,43 @@ class IndexCheckError(Exception):
     def __init__(self, check_name: str, check_value: Any, index: Type[pd.Index], result: pd.Series):
         self.check_name = check_name
         self.check_value = check_value
-        self.series = index.to_series()
+        self.index = index
         self.result = result
-        super().__init__(self._get_message())
+        super().__init__(check_name, check_value)
+
+    def __str__(self) -> str:
+        return self.message
+
+    @cached_property
+    def message(self) -> str:
+        """The formatted error message, built on first access."""
+        return self._get_message()
+
+    @cached_property
+    def series(self) -> pd.Series:
+        """The index as a series, only built when the error is inspected."""
+        return self.index.to_series()
+
+    @cached_property
+    def failed(self) -> np.ndarray:
+        """Boolean array that is True for the rows that failed the check."""
+        return failed_mask(self.result)
+
+    @cached_property
+    def fail_series(self) -> pd.Series:
+        """The rows of the series that failed the check."""
+        return self.series[self.failed]
 
     def _get_message(self) -> str:
-        fail_series = self.series[~self.result]
-        total = len(self.series)
-        fails = len(fail_series)
+        # Only the displayed rows are selected, not every failing row
+        head_positions = np.flatnonzero(self.failed)[:MAX_FAILURE_ROWS]
+        total = len(self.failed)
+        fails = int(np.count_nonzero(self.failed))
         fail_pc = int(round(100 * fails / total))
         check_name = self.check_name.replace("series_", "")
         text_msg = (
-            f"Column '{self.series.name}' failed check {check_name}({self.check_value}): "
+            f"Column '{self.index.name}' failed check {check_name}({self.check_value}): "
             f"{fails} of {total} ({fail_pc} %)"
         )
-        fails_msg = fail_series.head(MAX_FAILURE_ROWS).to_string()
+        fails_msg = self.index[head_positions].to_series().to_string()
         return f"{text_msg}\n{fails_msg}"
@@ -1,11 +1,10 @@
-import re
 from types import NoneType, UnionType
-from typing import Any, Type, Union
+from typing import Any, Callable, Type, Union, get_args, get_origin
 
 import numpy as np
 import pandas as pd
 
-from pandabear.column_checks import CHECK_NAME_FUNCTION_MAP
+from pandabear.column_checks import ALL_BLOCK_SIZE, compile_regex, mask_all
 from pandabear.exceptions import (
     CoersionError,
     ColumnCheckError,
@@ -20,8 +19,11 @@ from pandabear.model_components import (
     BaseConfig,
     Field,
     FieldInfo,
+    get_alias_matcher,
+    get_field_checks,
     get_index_type,
     is_type_index,
+    match_regex_aliases,
 )
 from pandabear.type_checking import is_of_type
 
@@ -48,15 +50,33 @@ class BaseModel:
         """
         return BaseConfig._override(cls.Config)
 
+    @classmethod
+    def _get_cached_config(cls):
+        """Get the config for the model, resolving it once per `Config` class.
+
+        `_get_config` builds a new config class (and checks every field of
+        `cls.Config`) each time it is called. The result is stored in the
+        class `__dict__` together with the `Config` it was resolved from, and
+        reused for as long as `cls.Config` is either of those two classes. So
+        replacing `cls.Config` with a different class still takes effect.
+        """
+        cached = cls.__dict__.get("__pandabear_config__")
+        if cached is not None and (cls.Config is cached[0] or cls.Config is cached[1]):
+            return cached[1]
+        config = cls._get_config()
+        cls.__pandabear_config__ = (cls.Config, config)
+        return config
+
     @classmethod
     def _validate_series_or_index(
-        cls, se_or_idx: pd.Series | Type[pd.Index], field: Field, typ: Any, coerce: bool
+        cls, se_or_idx: pd.Series | Type[pd.Index], checks: tuple, typ: Any, coerce: bool
     ) -> pd.Series:
         """Validate a series against a field and type.
 
         Args:
             se_or_idx: The series or Index (or Index substype) to validate.
-            field: The field to validate against.
+            checks: The active checks of the field to validate against, as
+                returned by `get_field_checks`.
             typ: The type to validate against.
             coerce: Whether to coerce the series to the type of the
                 field.
@@ -65,8 +85,6 @@ class BaseModel:
             se_or_idx: pd.Series | Type[pd.Index]: The validated series or Index.
         """
 
-        is_index = ~isinstance(se_or_idx, pd.Series)
-
         if not is_of_type(se_or_idx, typ):
             if coerce:
                 try:
@@ -78,19 +96,27 @@ class BaseModel:
                     f"Expected {f'`{se_or_idx.name}`' if se_or_idx.name else 'index'} with dtype {typ} but found dtype `{se_or_idx.dtype}`"
                 )
 
-        for check_name, check_func in CHECK_NAME_FUNCTION_MAP.items():
-            check_value = getattr(field, check_name)
-            if check_value is not None:
-                result = check_func(series=se_or_idx if is_index else se_or_idx.to_series(), value=check_value)
-                if not result.all():
-                    if is_index:
-                        raise ColumnCheckError(
-                            check_name=check_name, check_value=check_value, series=se_or_idx, result=result
-                        )
-                    else:
-                        raise IndexCheckError(
-                            check_name=check_name, check_value=check_value, index=se_or_idx, result=result
-                        )
+        # Plain type-only fields end here
+        if not checks:
+            return se_or_idx
+
+        # Checks work on an Index as well as on a Series, so index levels are
+        # checked as is. Only a failing check turns them into a series, for
+        # the error message.
+        for check, check_value in checks:
+            # Skip building the mask when the whole series is known to pass
+            if check.all_func is not None and check.all_func(se_or_idx, check_value):
+                continue
+            result = check.func(series=se_or_idx, value=check_value)
+            if not mask_all(result):
+                if isinstance(se_or_idx, pd.Index):
+                    raise IndexCheckError(
+                        check_name=check.name, check_value=check_value, index=se_or_idx, result=result
+                    )
+                else:
+                    raise ColumnCheckError(
+                        check_name=check.name, check_value=check_value, series=se_or_idx, result=result
+                    )
         return se_or_idx
 
 
@@ -100,7 +126,7 @@ class DataFrameModel(BaseModel):
         """Get a convenient representation of the schema.
 
         This method builds a dictionary that maps index/column names to a
-        tuple containing (type, optional, is_index, field). This is a
+        tuple containing (type, optional, is_index, field, checks). This is a
         convenient representation of the schema, because it allows easy access
         to otherwise hard-to-get information about the schema.
 
@@ -117,7 +143,8 @@ class DataFrameModel(BaseModel):
 
         Returns:
             schema_map (dict): A dictionary mapping index/column names to a
-                tuple containing (type, optional, is_index, field)
+                `FieldInfo` tuple containing (type, optional, is_index, field,
+                checks)
         """
         schema_map = {}
         for name, typ in cls.__annotations__.items():
@@ -129,30 +156,67 @@ class DataFrameModel(BaseModel):
                 # or a bare pandas.index type.
                 typ = get_index_type(typ)
 
-            schema_map[name] = (typ, optional, is_index, getattr(cls, name) if hasattr(cls, name) else Field())
+            field = getattr(cls, name) if hasattr(cls, name) else Field()
+            schema_map[name] = FieldInfo(typ, optional, is_index, field, get_field_checks(field))
         return schema_map
 
+    @classmethod
+    def _get_cached_schema_map(cls) -> dict[str, FieldInfo]:
+        """Get the schema map, building and validating it once per class.
+
+        The schema is a class-level declaration, so `_get_schema_map` and
+        `_validate_schema` only need to run the first time the schema is used.
+        The result is stored in the class `__dict__` (so subclasses never pick
+        up the cache of their parent), and a shallow copy is returned because
+        `_select_matching_names` may rename index entries in the map.
+        """
+        schema_map = cls.__dict__.get("__pandabear_schema_map__")
+        if schema_map is None:
+            schema_map = cls._get_schema_map()
+            cls._validate_schema(schema_map)
+            cls.__pandabear_schema_map__ = schema_map
+        return schema_map.copy()
+
     @staticmethod
     def _check_optional_type(typ: type) -> tuple[type, bool]:
-        """Check if a type is optional and return the non-optional type."""
-        optional = False
-        if hasattr(typ, "__args__") and type(None) in typ.__args__:
-            optional = True
-            typ = Union[tuple(arg for arg in typ.__args__ if arg is not type(None))]
-        return typ, optional
+        """Check if a type is optional and return the non-optional type.
+
+        Only unions (`X | None`, `Optional[X]`) make a type optional, so e.g.
+        `dict[str, None]` is left as is.
+        """
+        args = get_args(typ)
+        if get_origin(typ) not in (Union, UnionType) or NoneType not in args:
+            return typ, False
+        non_none_args = tuple(arg for arg in args if arg is not NoneType)
+        # `X | None` is by far the most common case, and needs no new Union
+        if len(non_none_args) == 1:
+            return non_none_args[0], True
+        return Union[non_none_args], True
 
     @staticmethod
-    def _override_level(
-        df_index: Type[pd.Index], index_level: str, new_index_values: Type[pd.Index]
-    ) -> pd.MultiIndex | pd.Index:
-        """Override a level in a MultiIndex or Index with a new index."""
+    def _override_levels(df_index: Type[pd.Index], new_levels: dict[str, Any]) -> pd.MultiIndex | pd.Index:
+        """Override levels in a MultiIndex or Index with new values.
+
+        Args:
+            df_index: The index to override levels in.
+            new_levels: Maps the names of the levels to override to their new
+                values.
+        """
         if isinstance(df_index, pd.MultiIndex):
-            df_tmp = df_index.to_frame(index=False)
-            if index_level not in df_tmp.columns:
-                raise ValueError(f"Index level '{index_level}' not found in MultiIndex.")
-            df_tmp[index_level] = new_index_values
-            return pd.MultiIndex.from_frame(df_tmp)
+            for index_level in new_levels:
+                if index_level not in df_index.names:
+                    raise ValueError(f"Index level '{index_level}' not found in MultiIndex.")
+            # Rebuild once from the level arrays, replacing only the overridden
+            # ones, rather than round-tripping every level through a dataframe
+            return pd.MultiIndex.from_arrays(
+                [
+                    new_levels[name] if name in new_levels else df_index.get_level_values(i)
+                    for i, name in enumerate(df_index.names)
+                ],
+                names=df_index.names,
+            )
         else:
+            ((index_level, new_index_values),) = new_levels.items()
             if df_index.name != index_level:
                 raise ValueError(f"Index name '{df_index.name}' does not match given index_level '{index_level}'.")
             index_type_map = {
@@ -161,12 +225,30 @@ class DataFrameModel(BaseModel):
                 pd.PeriodIndex: pd.PeriodIndex,
                 pd.TimedeltaIndex: pd.TimedeltaIndex,
                 pd.CategoricalIndex: pd.CategoricalIndex,
-                pd.RangeIndex: pd.RangeIndex,
+                # Coerced values are never a range, so they become a plain Index
+                pd.RangeIndex: pd.Index,
                 pd.IntervalIndex: pd.IntervalIndex,
             }
             index_type = index_type_map.get(type(df_index))
             return index_type(new_index_values, name=index_level)
 
+    @staticmethod
+    def _sorted_index_is_unique(index: Type[pd.Index]) -> bool:
+        """Check whether a sorted index has no duplicates.
+
+        Equal entries of a sorted MultiIndex are adjacent, so comparing the
+        level codes of neighbouring rows finds them without hashing every row,
+        which `MultiIndex.is_unique` does. Other indexes already get this from
+        their engine.
+        """
+        if not isinstance(index, pd.MultiIndex) or len(index) < 2:
+            return index.is_unique
+        codes = index.codes
+        repeated = codes[0][1:] == codes[0][:-1]
+        for level_codes in codes[1:]:
+            repeated &= level_codes[1:] == level_codes[:-1]
+        return not repeated.any()
+
     @staticmethod
     def _select_index_series(df: pd.DataFrame, level: str, optional: bool = True) -> list[Type[pd.Index]]:
         """Select a series from a dataframe by column name.
@@ -206,12 +288,21 @@ class DataFrameModel(BaseModel):
     @staticmethod
     def _select_index_series_by_regex(df: pd.DataFrame, alias: str) -> list[Type[pd.Index]]:
         """Select a series from a dataframe by regex."""
-        return [df.index.get_level_values(level) for level in df.index.names if re.match(alias, level) is not None]
+        matches_alias = get_alias_matcher(alias)
+        return [df.index.get_level_values(level) for level in df.index.names if matches_alias(level)]
 
     @staticmethod
-    def _select_series_by_regex(df: pd.DataFrame, alias: str) -> list[pd.Series]:
+    def _select_columns_by_regex(df: pd.DataFrame, alias: str) -> list[str]:
+        """Select the names of columns in a dataframe by regex."""
+        # Same selection as `df.filter(regex=alias, axis=1)`, but with the
+        # pattern compiled once instead of on every call
+        search = compile_regex(alias).search
+        return [col for col in df.columns if search(str(col)) is not None]
+
+    @classmethod
+    def _select_series_by_regex(cls, df: pd.DataFrame, alias: str) -> list[pd.Series]:
         """Select a series from a dataframe by regex."""
-        return [df[col] for col in df.filter(regex=alias, axis=1).columns]
+        return [df[col] for col in cls._select_columns_by_regex(df, alias)]
 
     @classmethod
     def _check_type_is_valid(cls, typ: Any) -> bool:
@@ -229,34 +320,55 @@ class DataFrameModel(BaseModel):
             return all(cls._check_type_is_valid(arg) for arg in typ.__args__)
         raise UnsupportedTypeError(f"Type `{typ}` is not supported")
 
+    @classmethod
+    def _get_custom_checks(cls) -> tuple[tuple[str, Callable, tuple[str, ...] | NoneType], ...]:
+        """Get the custom checks defined on the schema.
+
+        The `check` and `dataframe_check` decorators mark methods with a
+        `__check__` attribute. This method loops through all attributes on the
+        schema once, and stores `(attr_name, method, check_columns)` for every
+        marked method in the class `__dict__`, so later validations don't have
+        to scan `dir(cls)` again.
+
+        Raises:
+            SchemaDefinitionError: If a custom check references columns that
+                are not defined in the schema.
+        """
+        custom_checks = cls.__dict__.get("__pandabear_custom_checks__")
+        if custom_checks is None:
+            custom_checks = []
+            for attr_name in dir(cls):
+                attr = getattr(cls, attr_name)
+                if not hasattr(attr, "__check__"):
+                    continue
+
+                check_columns: tuple[str, ...] | NoneType = getattr(attr, "__check__")
+
+                if check_columns is not None and any(
+                    undefined_columns := [c for c in check_columns if c not in cls.__annotations__]
+                ):
+                    raise SchemaDefinitionError(
+                        f"Decorator on custom check `{attr_name}` references undefined columns {undefined_columns}. Values passed to the `check` decorator must reference columns defined in the schema."
+                    )
+                custom_checks.append((attr_name, attr, check_columns))
+            custom_checks = cls.__pandabear_custom_checks__ = tuple(custom_checks)
+        return custom_checks
+
     @classmethod
     def _validate_custom_checks(cls, df: pd.DataFrame):
         """Validate custom checks defined on the schema.
 
         The `check` decorator can be used to define custom checks on the
-        schema. This method will loop through all attributes on the schema and
-        check if they have the `__check__` attribute. If they do, it means they
-        are decorated with the `check` decorator and should be run on the
-        dataframe.
+        schema. This method runs every check found by `_get_custom_checks`,
+        either on the whole dataframe or on each of the columns it names.
         """
-        for attr_name in dir(cls):
-            attr = getattr(cls, attr_name)
-            if not hasattr(attr, "__check__"):
-                continue
-
-            check_columns: list[str] | NoneType = getattr(attr, "__check__")
-
+        for attr_name, attr, check_columns in cls._get_custom_checks():
             if check_columns is None:
                 # assumes check is for whole df
                 if not attr(df):
                     raise ValueError(f"DataFrame did not pass custom check `{attr_name}`")
                 continue
 
-            if any(undefined_columns := [c for c in check_columns if c not in cls.__annotations__]):
-                raise SchemaDefinitionError(
-                    f"Decorator on custom check `{attr_name}` references undefined columns {undefined_columns}. Values passed to the `check` decorator must reference columns defined in the schema."
-                )
-
             for column in check_columns:
                 if not attr(df[column]):
                     raise ValueError(f"Column `{column}` did not pass custom check `{attr_name}`")
@@ -270,7 +382,7 @@ class DataFrameModel(BaseModel):
         non-numeric columns, etc.
         """
         using_check_index_name = []
-        for name, (typ, optional, is_index, field) in schema_map.items():
+        for name, (typ, optional, is_index, field, _) in schema_map.items():
             # Check that there are not multiple index columns if `check_index_name` is False
             if is_index:
                 using_check_index_name.append(field.check_index_name)
@@ -308,24 +420,34 @@ class DataFrameModel(BaseModel):
         pass `df` through with coerced types, filtered index levels, ordered
         index levels or as-is.
         """
-        matching_index_names_in_df = cls._select_matching_names(list(df.index.names), match_index=True)
+        index_names = list(df.index.names)
+        matching_index_names_in_df = cls._select_matching_names(index_names, match_index=True)
+        matching_index_name_set = set(matching_index_names_in_df)
 
         if cls.Config.filter:
             # Make sure that only the matching index levels are kept
-            if df.index.names != [None] and len(matching_index_names_in_df) < len(df.index.names):
+            if index_names != [None] and len(matching_index_names_in_df) < len(index_names):
+                # Only the index is replaced here, without copying the data:
+                # filtering the columns in `_validate_columns` builds the
+                # fresh frame that `validate` works on
                 if len(matching_index_names_in_df) == 0:
-                    df = df.reset_index(drop=True, inplace=True)
+                    df = df.set_axis(pd.RangeIndex(len(df)), axis=0, copy=False)
+                    index_names = [None]
                 else:
-                    df = df.droplevel([ind for ind in df.index.names if ind not in matching_index_names_in_df])
+                    index = df.index.droplevel([ind for ind in index_names if ind not in matching_index_name_set])
+                    df = df.set_axis(index, axis=0, copy=False)
+                    index_names = [ind for ind in index_names if ind in matching_index_name_set]
 
         if cls.Config.multiindex_strict:
-            if unexpected_indices := set(df.index.names) - set(matching_index_names_in_df) - set([None]):
+            if unexpected_indices := {
+                ind for ind in index_names if ind is not None and ind not in matching_index_name_set
+            }:
                 raise SchemaValidationError(
                     f"MultiIndex names {unexpected_indices} are present in `df` but not defined in schema. Use `multiindex_strict=False` to supress this error."
                 )
 
         if cls.Config.multiindex_ordered:
-            if df.index.names != [None] and matching_index_names_in_df != list(df.index.names):
+            if index_names != [None] and matching_index_names_in_df != index_names:
                 raise SchemaValidationError(
                     "MultiIndex names in `df` are not ordered as in schema. Use `multiindex_ordered=False` to supress this error."
                 )
@@ -337,7 +459,12 @@ class DataFrameModel(BaseModel):
                 )
 
         if cls.Config.multiindex_unique:
-            if not df.index.is_unique:
+            # A sorted index, as checked above, holds duplicates next to each other
+            if cls.Config.multiindex_sorted:
+                is_unique = cls._sorted_index_is_unique(df.index)
+            else:
+                is_unique = df.index.is_unique
+            if not is_unique:
                 raise SchemaValidationError(
                     "MultiIndex is not unique. Use `multiindex_unique=False` to supress this error."
                 )
@@ -355,16 +482,26 @@ class DataFrameModel(BaseModel):
         pass `df` through with coerced types, filtered columns, ordered columns
         or as-is.
         """
-        matching_columns_in_df = cls._select_matching_names(list(df.columns))
+        df_columns = df.columns.tolist()
+        matching_columns_in_df = cls._select_matching_names(df_columns)
 
         # Drop columns in `df` that do not match the schema
         if cls.Config.filter:
-            ordered_columns_in_df = [col for col in df.columns if col in matching_columns_in_df]
-            df = df[ordered_columns_in_df].copy()
+            # `take` builds the narrower frame directly; `df[columns].copy()`
+            # copied the selected columns twice. Unlike `df[columns]`, it
+            # also doesn't flag the result as a copy of a slice of `df`.
+            matching_column_set = set(matching_columns_in_df)
+            keep = [i for i, col in enumerate(df_columns) if col in matching_column_set]
+            df = df.take(keep, axis=1)
+            df_columns = [df_columns[i] for i in keep]
 
         # Complain about columns in `df` that are not defined in the schema
         elif cls.Config.strict:
-            if unexpected_columns := set(df.columns) - set(matching_columns_in_df):
+            # When the schema matches `df` column for column, in order, there
+            # is nothing unexpected, and no sets need to be built
+            if matching_columns_in_df != df_columns and (
+                unexpected_columns := set(df_columns).difference(matching_columns_in_df)
+            ):
                 raise SchemaValidationError(
                     f"Columns {unexpected_columns} are present in `df` but not in schema. Use `strict=False` or `filter=True` to supress this error."
                 )
@@ -372,7 +509,7 @@ class DataFrameModel(BaseModel):
         # Complain if the order of columns in `df` does not match the order in
         # which they are defined in the schema
         if cls.Config.ordered:
-            if matching_columns_in_df != list(df.columns):
+            if matching_columns_in_df != df_columns:
                 raise SchemaValidationError(
                     "Columns in `df` are not ordered as in schema. Use `ordered=False` to supress this error."
                 )
@@ -405,38 +542,45 @@ class DataFrameModel(BaseModel):
         """
         MissingNameError = MissingIndexError if match_index else MissingColumnsError
         series_type = "index level" if match_index else "column"
+        name_set = set(names)
+
+        # Match all regex aliases against `names` in one pass up front
+        regex_aliases = tuple(
+            field.alias
+            for _, _, is_index, field, _ in cls.schema_map.values()
+            if is_index == match_index and field.alias is not None and field.regex
+        )
+        matched_by_alias = dict(zip(regex_aliases, match_regex_aliases(regex_aliases, tuple(names))))
+
         matching_names = []
-        for series_name, (_, optional, is_index, field) in cls.schema_map.items():
+        # Missing names are collected, so that all of them are reported at once
+        missing = []
+        for series_name, (_, optional, is_index, field, _) in cls.schema_map.items():
             if is_index and not match_index:
                 continue
             elif not is_index and match_index:
                 continue
             if field.alias is not None and field.regex:
-                matched = [name for name in names if re.match(field.alias, name)]
+                matched = list(matched_by_alias[field.alias])
                 if len(matched) == 0 and not optional:
-                    raise MissingNameError(
-                        f"No {series_type}s match regex `{field.alias}` for field `{series_name}` in schema `{cls.__name__}`"
-                    )
+                    missing.append(f"regex `{field.alias}` for field `{series_name}`")
                 elif len(already_matched := set(matched) & set(matching_names)) > 0:
                     raise SchemaDefinitionError(
                         f"Regex `{field.alias}` for field `{series_name}` in schema `{cls.__name__}` matched {series_type}s {already_matched} already matched by another field."
                     )
                 matching_names.extend(matched)
             elif field.alias is not None and field.regex is False:
-                if field.alias not in names and not optional:
-                    raise MissingNameError(
-                        f"No {series_type}s match alias `{field.alias}` for field `{series_name}` in schema `{cls.__name__}`."
-                    )
+                if field.alias not in name_set and not optional:
+                    missing.append(f"alias `{field.alias}` for field `{series_name}`")
+                    continue
                 elif field.alias in matching_names:
                     raise SchemaDefinitionError(
                         f"Alias `{field.alias}` for field `{series_name}` in schema `{cls.__name__}` is used by another field."
                     )
                 matching_names.append(field.alias)
             else:
-                if series_name not in names and not optional and field.check_index_name:  # field
-                    raise MissingNameError(
-                        f"No {series_type}s match {series_type} name `{series_name}` in schema `{cls.__name__}`."
-                    )
+                if series_name not in name_set and not optional and field.check_index_name:  # field
+                    missing.append(f"{series_type} name `{series_name}`")
                 elif series_name in matching_names:
                     raise SchemaDefinitionError(
                         f"{series_type.capitalize()} `{series_name}` in schema `{cls.__name__}` is used by another field."
@@ -447,8 +591,82 @@ class DataFrameModel(BaseModel):
                     return names
                 else:
                     matching_names.append(series_name)
+        if missing:
+            raise MissingNameError(f"No {series_type}s match {', '.join(missing)} in schema `{cls.__name__}`.")
         return matching_names
 
+    @classmethod
+    def _select_field_series(
+        cls, df: pd.DataFrame, name: str, is_index: bool, field: Field, optional: bool
+    ) -> list[pd.Series | Type[pd.Index]]:
+        """Select the columns or index levels in `df` that match a field."""
+        # ... when index column
+        if is_index:
+            if field.regex and field.alias is not None:
+                return cls._select_index_series_by_regex(df, field.alias)
+            return cls._select_index_series(df, field.alias or name, optional)
+
+        # ... when column has aliased name
+        if field.alias is not None:
+            if field.regex:
+                return cls._select_series_by_regex(df, field.alias)
+            return cls._select_series(df, field.alias, optional)
+
+        # ... when column name is attribute name (not alias)
+        return cls._select_series(df, name, optional)
+
+    @classmethod
+    def _coerce_columns(cls, df: pd.DataFrame) -> pd.DataFrame:
+        """Coerce the columns of `df` that need it with a single `astype` call.
+
+        Index levels are left alone. If the batch conversion fails, `df` is
+        returned as is, and validating the columns one by one raises the
+        error for the column that can't be coerced.
+        """
+        dtypes = {}
+        config_coerce = cls.Config.coerce
+        for name, (typ, optional, is_index, field, _) in cls.schema_map.items():
+            if is_index or not (config_coerce or field.coerce):
+                continue
+            for series in cls._select_field_series(df, name, is_index, field, optional):
+                if not is_of_type(series, typ):
+                    dtypes[series.name] = typ
+        if not dtypes:
+            return df
+        try:
+            return df.astype(dtypes, copy=False)
+        except (TypeError, ValueError):
+            return df
+
+    @staticmethod
+    def _columns_pass_checks(df: pd.DataFrame, columns: list[str], checks: tuple, typ: Any) -> bool:
+        """Check whether all `columns` have type `typ` and pass all `checks`.
+
+        The checks run in one 2-D pass per check. Only decides for columns
+        that already have the expected type (so no coercion is needed) and
+        checks that accept a dataframe. A False result means that the columns
+        must be validated one by one, which also produces the error for the
+        offending column.
+
+        Gathering the columns copies their data, so this is only done for
+        groups of at most `ALL_BLOCK_SIZE` values, where the copy is cheaper
+        than the per-column overhead. Larger groups are left to the
+        per-column checks, which compare views without allocating.
+        """
+        if not all(check.accepts_frame for check, _ in checks):
+            return False
+        # The columns must share one dtype to be compared as a single 2-D
+        # array, and then one type check covers all of them. Both are decided
+        # from `df.dtypes` before the columns are gathered into a frame.
+        if len(set(df.dtypes[columns])) != 1 or not is_of_type(df[columns[0]], typ):
+            return False
+        if not checks:
+            return True
+        if len(df) * len(columns) > ALL_BLOCK_SIZE:
+            return False
+        frame = df[columns]
+        return all(check.all_func(frame, check_value) for check, check_value in checks)
+
     @classmethod
     def validate(cls, df: pd.DataFrame) -> pd.DataFrame:
         """Validate a dataframe against the schema.
@@ -475,54 +693,62 @@ class DataFrameModel(BaseModel):
                 This could e.g. happen when a column is of the wrong dtype or
                 when a custom check fails.
         """
-        df = df.copy()
-
-        cls.schema_map = cls._get_schema_map()
-        cls.Config = cls._get_config()
-
-        # Validate schema definition. Catch errors like, e.g., missing aliases
-        # when regex=True, number checks on non-numeric columns, etc.
-        cls._validate_schema(cls.schema_map)
+        # Get the schema map. The first call validates the schema definition,
+        # catching errors like, e.g., missing aliases when regex=True, number
+        # checks on non-numeric columns, etc.
+        cls.schema_map = cls._get_cached_schema_map()
+        cls.Config = cls._get_cached_config()
 
         # Check that indices and columns in `df` match schema. The only errors
         # that should be thrown here relate to schema errors or missing columns
         # in `df`. Furthermore, this method may filter, coerce or order `df`
         # depending on user-provided specifications in `Config`.
+        original_df = df
         df = cls._validate_multiindex(df)
         df = cls._validate_columns(df)
 
+        # With `filter` set, filtering the columns already builds a new frame
+        # (dropped index levels only replace the index of a shallow copy, and
+        # are always followed by that step). Otherwise, copy `df`, so that
+        # writes to the returned frame never reach the caller's. Under copy-on-write a shallow copy gives
+        # the same guarantee, with the data only copied once it is written to.
+        if df is original_df:
+            df = df.copy(deep=not pd.options.mode.copy_on_write)
+
         # Validate `df` against schema. The only errors that should be raised
         # in this step are from dtype checks and `Field` checks.
-        for name, (typ, optional, is_index, field) in cls.schema_map.items():
-            # Select the column (or columns) in `df` that match the field.
-            # ... when index column
-            if is_index:
-                if field.regex and field.alias is not None:
-                    matched_series_or_index = cls._select_index_series_by_regex(df, field.alias)
-                else:
-                    matched_series_or_index = cls._select_index_series(df, field.alias or name, optional)
+        # Coerce every column that needs it in one go, rather than one
+        # `astype` and one write to `df` per column.
+        df = cls._coerce_columns(df)
 
-            # ... when column has aliased name
-            elif field.alias is not None:
-                if field.regex:
-                    matched_series_or_index = cls._select_series_by_regex(df, field.alias)
-                else:
-                    matched_series_or_index = cls._select_series(df, field.alias, optional)
-
-            # ... when column name is attribute name (not alias)
+        config_coerce = cls.Config.coerce
+        coerced_levels = {}
+        for name, (typ, optional, is_index, field, checks) in cls.schema_map.items():
+            # Select the column (or columns) in `df` that match the field.
+            if not is_index and field.regex and field.alias is not None:
+                # Columns matched by the same regex field share their type and
+                # checks, so try to clear all of them at once, by name, before
+                # falling back to validating the columns one by one.
+                columns = cls._select_columns_by_regex(df, field.alias)
+                if len(columns) > 1 and cls._columns_pass_checks(df, columns, checks, typ):
+                    continue
+                matched_series_or_index = [df[col] for col in columns]
             else:
-                matched_series_or_index = cls._select_series(df, name, optional)
+                matched_series_or_index = cls._select_field_series(df, name, is_index, field, optional)
 
             # Validate the selected column(s) against the field and type.
             for series_or_index in matched_series_or_index:
-                series_or_index = cls._validate_series_or_index(
-                    series_or_index, field, typ, cls.Config.coerce or field.coerce
-                )
-                if cls.Config.coerce or field.coerce:
+                validated = cls._validate_series_or_index(series_or_index, checks, typ, config_coerce or field.coerce)
+                # Only write back what was actually coerced
+                if validated is not series_or_index:
                     if is_index:
-                        df.index = cls._override_level(df.index, series_or_index.name, series_or_index.values)
+                        coerced_levels[validated.name] = validated.values
                     else:
-                        df[series_or_index.name] = series_or_index
+                        df[validated.name] = validated
+
+        # Coerced index levels are set in one go, building the index only once
+        if coerced_levels:
+            df.index = cls._override_levels(df.index, coerced_levels)
 
         cls._validate_custom_checks(df)
 
@@ -532,13 +758,26 @@ class DataFrameModel(BaseModel):
 class SeriesModel(BaseModel):
     @classmethod
     def _get_value_name_and_type(cls):
-        return list(cls.__annotations__.items())[0]
+        return next(iter(cls.__annotations__.items()))
 
     @classmethod
     def _get_field(cls):
         value_name, _ = cls._get_value_name_and_type()
         return getattr(cls, value_name)
 
+    @classmethod
+    def _get_cached_value_info(cls) -> tuple[Any, tuple]:
+        """Get the value type and active checks of the schema, once per class.
+
+        Like `DataFrameModel._get_cached_schema_map`, the result is stored in
+        the class `__dict__`, so subclasses resolve their own.
+        """
+        value_info = cls.__dict__.get("__pandabear_value_info__")
+        if value_info is None:
+            _, value_type = cls._get_value_name_and_type()
+            value_info = cls.__pandabear_value_info__ = (value_type, get_field_checks(cls._get_field()))
+        return value_info
+
     @classmethod
     def validate(cls, series: pd.Series):
         """Validate a series against the schema.
@@ -549,8 +788,7 @@ class SeriesModel(BaseModel):
         Returns:
             pandas.Series: The validated series.
         """
-        _, value_type = cls._get_value_name_and_type()
-        field = cls._get_field()
-        Config = cls._get_config()
-        series = cls._validate_series_or_index(series, field, value_type, Config.coerce)
+        value_type, checks = cls._get_cached_value_info()
+        Config = cls._get_cached_config()
+        series = cls._validate_series_or_index(series, checks, value_type, Config.coerce)
         return series
@@ -1,8 +1,10 @@
 import dataclasses
-from typing import Any, NamedTuple, Type, Union
+from functools import lru_cache
+from typing import Any, Callable, NamedTuple, Type, Union
 
 import pandas as pd
 
+from pandabear.column_checks import CHECKS, Check, compile_regex, is_literal_pattern
 from pandabear.exceptions import SchemaDefinitionError, UnsupportedTypeError
 
 PANDAS_INDEX_TYPES = [
@@ -112,6 +114,22 @@ class FieldInfo(NamedTuple):
     optional: bool
     is_index: bool
     field: Field
+    checks: tuple[tuple[Check, Any], ...] = ()
+
+
+def get_field_checks(field: Field) -> tuple[tuple[Check, Any], ...]:
+    """Resolve the checks that are active on `field`.
+
+    Returns a tuple of `(check, check_value)` for every check in `CHECKS` that
+    is set on the field, so that validation doesn't have to probe every check
+    name on every call. Checks are ordered by `Check.cost`, cheapest first.
+    """
+    checks = []
+    for check in sorted(CHECKS, key=lambda check: check.cost):
+        check_value = getattr(field, check.name)
+        if check_value is not None:
+            checks.append((check, check_value))
+    return tuple(checks)
 
 
 def is_type_index_wrapped(typ):
@@ -136,6 +154,37 @@ def is_type_index(typ, name, class_name):
     return False
 
 
+@lru_cache(maxsize=512)
+def get_alias_matcher(alias: str) -> Callable[[str], Any]:
+    """Get a function that tells whether a name matches a regex alias.
+
+    Matching follows `re.match` semantics (anchored at the start of the name).
+    Aliases without metacharacters (e.g. `"spend___"`) are plain prefixes, so
+    they bypass the regex engine entirely.
+    """
+    if is_literal_pattern(alias):
+        return lambda name: name.startswith(alias)
+    return compile_regex(alias).match
+
+
+@lru_cache(maxsize=128)
+def match_regex_aliases(aliases: tuple[str, ...], names: tuple[str, ...]) -> tuple[tuple[str, ...], ...]:
+    """Match many regex aliases against many names in a single pass.
+
+    Each name is tested against every alias once, and the names matched by
+    each alias are returned in the same order as `aliases`. Results are
+    memoized on the `(aliases, names)` pair, so validating frames with the
+    same layout against the same schema skips regex matching entirely.
+    """
+    matchers = [get_alias_matcher(alias) for alias in aliases]
+    matched = [[] for _ in aliases]
+    for name in names:
+        for i, matches_alias in enumerate(matchers):
+            if matches_alias(name):
+                matched[i].append(name)
+    return tuple(tuple(m) for m in matched)
+
+
 def get_index_type(typ):
     if is_type_index_wrapped(typ):
         return typ.__args__[1]
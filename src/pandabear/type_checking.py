@@ -3,11 +3,30 @@ import datetime
 import numpy as np
 import pandas as pd
 
+# Built once, so type checks don't construct (or convert `typ` to) a dtype on
+# every call. Numpy dtypes of builtin kinds are singletons, so the identity
+# test in `check_dtype_is` usually decides without a full comparison.
+OBJECT_DTYPE = np.dtype("O")
+DATETIME64_DTYPE = np.dtype("datetime64[ns]")
+TYPE_DTYPE_MAP = {
+    int: np.dtype(int),
+    float: np.dtype(float),
+    bool: np.dtype(bool),
+}
+
 
 def check_dtype_equality(series_or_index, typ):
     return series_or_index.dtype == typ
 
 
+def check_dtype_is(series_or_index, dtype):
+    return series_or_index.dtype is dtype or series_or_index.dtype == dtype
+
+
+def check_builtin_dtype(series_or_index, typ):
+    return check_dtype_is(series_or_index, TYPE_DTYPE_MAP[typ])
+
+
 def check_isinstance(series_or_index, typ):
     return isinstance(series_or_index, typ)
 
@@ -17,11 +36,11 @@ def check_type_is(series_or_index, typ):
 
 
 def check_str_object(series_or_index, typ):
-    return check_dtype_equality(series_or_index, np.dtype("O"))
+    return check_dtype_is(series_or_index, OBJECT_DTYPE)
 
 
 def check_datetime64(series_or_index, typ):
-    return check_dtype_equality(series_or_index, np.dtype("datetime64[ns]"))
+    return check_dtype_is(series_or_index, DATETIME64_DTYPE)
 
 
 def check_str_expensive(series_or_index, typ):
@@ -35,9 +54,9 @@ def check_bare_categorical_dtype(series_or_index, typ):
 
 
 TYPE_CHECK_MAP = {
-    int: check_dtype_equality,
-    float: check_dtype_equality,
-    bool: check_dtype_equality,
+    int: check_builtin_dtype,
+    float: check_builtin_dtype,
+    bool: check_builtin_dtype,
     str: check_str_object,
     np.datetime64: check_datetime64,
     datetime.datetime: check_datetime64,
@@ -49,8 +68,11 @@ TYPE_CHECK_MAP = {
 
 
 def is_of_type(series_or_index, typ):
-    if typ in TYPE_CHECK_MAP:
-        return TYPE_CHECK_MAP[typ](series_or_index, typ)
-    if isinstance(typ, type(pd.CategoricalDtype())):
+    # Categorical dtype instances are matched first, since hashing them for
+    # the map lookup means hashing all their categories.
+    if isinstance(typ, pd.CategoricalDtype):
         return check_dtype_equality(series_or_index, typ)
+    check = TYPE_CHECK_MAP.get(typ)
+    if check is not None:
+        return check(series_or_index, typ)
     check_dtype_equality(series_or_index, typ)
@@ -583,3 +583,88 @@ class TestBaseCaseFailureSeries:
                 return se, se, se
 
             my_function(se)
+
+
+class TestCheckSchemasSignature:
+    def test___signature__resolved_once(self, monkeypatch):
+        """Test that the decorated function's signature is not re-resolved on every call."""
+        import inspect
+
+        calls = []
+        signature = inspect.signature
+
+        def counting_signature(*args, **kwargs):
+            calls.append(args)
+            return signature(*args, **kwargs)
+
+        monkeypatch.setattr(inspect, "signature", counting_signature)
+
+        @check_schemas
+        def my_function(df: DataFrame[MySchema]) -> DataFrame[MySchema]:
+            return df
+
+        n_calls = len(calls)
+        my_function(df)
+        my_function(df)
+        assert len(calls) == n_calls
+
+    def test___arguments__keyword_and_default(self):
+        """Test that arguments passed by keyword, or left to their default, are validated."""
+
+        @check_schemas
+        def my_function(n: int, df: DataFrame[MySchemaFailure] = df) -> int:
+            return n
+
+        with pytest.raises(ColumnCheckError):
+            my_function(1)
+        with pytest.raises(ColumnCheckError):
+            my_function(n=1, df=df)
+
+    def test___arguments__variadic(self):
+        """Test that functions taking `*args` and `**kwargs` are still validated."""
+
+        @check_schemas
+        def my_function(df: DataFrame[MySchema], *args, **kwargs) -> DataFrame[MySchema]:
+            return df
+
+        my_function(df, 1, 2, key="value")
+        with pytest.raises(TypeHintError):
+            my_function("df", 1)
+
+    def test___no_schema__not_wrapped(self):
+        """Test that functions without `DataFrameModel` type hints are returned as is."""
+
+        def my_function(n: int, pair: tuple[int, str]) -> list[int]:
+            return [n]
+
+        assert check_schemas(my_function) is my_function
+
+    def test___arguments__variadic_names(self):
+        """Test that variadic and keyword-only parameters are passed on whatever their names."""
+
+        @check_schemas
+        def my_function(df: DataFrame[MySchema], *rest, flag: bool = False, **options) -> tuple:
+            return rest, flag, options
+
+        assert my_function(df, 1, 2, flag=True, key="value") == ((1, 2), True, {"key": "value"})
+
+    def test___no_return_type_hint(self):
+        """Test that functions with schema arguments but no return type hint return values as is."""
+        result = object()
+
+        @check_schemas
+        def my_function(df: DataFrame[MySchema]):
+            return result
+
+        assert my_function(df) is result
+
+    def test___arguments__not_modified(self):
+        """Test that writes inside a decorated function don't reach the caller's dataframe."""
+
+        @check_schemas
+        def my_function(df: DataFrame[MySchema]) -> None:
+            df.loc[df.column_c > 0.15, "column_c"] = 0.0
+
+        df_in = df.copy()
+        my_function(df_in)
+        assert df_in.column_c.tolist() == [0.1, 0.2, 0.3]
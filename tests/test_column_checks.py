@@ -3,6 +3,14 @@ import pandas as pd
 import pytest
 
 from pandabear.column_checks import (
+    is_literal_pattern,
+    mask_all,
+    series_all_greater,
+    series_all_greater_equal,
+    series_all_less,
+    series_all_less_equal,
+    series_all_nullable,
+    series_all_unique,
     series_greater,
     series_greater_equal,
     series_isin,
@@ -13,8 +21,9 @@ from pandabear.column_checks import (
     series_str_contains,
     series_str_endswith,
     series_str_startswith,
+    series_unique,
 )
-from pandabear.exceptions import ColumnCheckError
+from pandabear.exceptions import ColumnCheckError, IndexCheckError
 
 
 def test_series_greater_equal():
@@ -63,6 +72,23 @@ def test_series_isin():
     assert series_isin(pd.Series(["a", "b", "b"]), ["a", "b"]).all()
 
 
+def test_series_isin_small_numeric_set():
+    assert series_isin(pd.Series([1, 2, 3]), [1, 3]).tolist() == [True, False, True]
+    assert series_isin(pd.Series([1.0, 2.5, np.nan]), (2.5, 1)).tolist() == [True, True, False]
+    assert series_isin(pd.Series([1.0, np.nan]), [np.nan, 1]).tolist() == [True, True]
+    assert series_isin(pd.Index([1, 2, 3]), {2}).tolist() == [False, True, False]
+
+    # Same container as `isin`: a Series on the series' index, an ndarray for an Index
+    series = pd.Series([1, 2, 3], index=["a", "b", "c"], name="x")
+    pd.testing.assert_series_equal(series_isin(series, [1, 3]), series.isin([1, 3]))
+    assert isinstance(series_isin(pd.Index([1, 2, 3]), [2]), np.ndarray)
+
+    # Narrow dtypes agree with `isin`, which doesn't cast the members down
+    float32_series = pd.Series([1.1, 2.0], dtype="float32")
+    assert series_isin(float32_series, [1.1, 2]).tolist() == float32_series.isin([1.1, 2]).tolist() == [False, True]
+    assert series_notin(float32_series, [1.1]).tolist() == [True, True]
+
+
 def test_series_notin():
     assert series_notin(pd.Series([1, 2, 3]), [4]).all()
     assert not series_notin(pd.Series([1, 2, 2]), [2]).all()
@@ -70,6 +96,15 @@ def test_series_notin():
     assert series_notin(pd.Series(["a", "b", "c"]), ["d", "e"]).all()
     assert not series_notin(pd.Series(["a", "b", "b"]), ["a", "b"]).all()
 
+    # Same container as `~isin`, for plain, unrolled and nullable masks
+    for series, value in [
+        (pd.Series(["a", "b"], index=[3, 4], name="x"), ["a"]),
+        (pd.Series([1, 2], index=[3, 4], name="x"), [1]),
+        (pd.Series([1, None], index=[3, 4], name="x", dtype="Int64"), [1]),
+    ]:
+        pd.testing.assert_series_equal(series_notin(series, value), ~series.isin(value))
+    assert series_notin(pd.Index([1, 2]), [1]).tolist() == [False, True]
+
 
 def test_series_str_contains():
     assert not series_str_contains(pd.Series(["a", "b", "c"]), "b").all()
@@ -77,6 +112,23 @@ def test_series_str_contains():
     assert not series_str_contains(pd.Series(["a", "b", "c"]), "0").all()
 
 
+def test_series_str_contains_literal():
+    assert is_literal_pattern("foo")
+    assert not is_literal_pattern("fo+")
+    assert series_str_contains(pd.Series(["foo", "a foo b"]), "foo").all()
+    assert not series_str_contains(pd.Series(["foo", "bar", None]), "foo").all()
+    assert series_str_contains(pd.Series(["fooo", "foo"]), "fo+").all()
+    assert not series_str_contains(pd.Series(["fo.o"]), "foo").all()
+
+    # Arrow-backed strings, for literal and regex patterns
+    pa = pytest.importorskip("pyarrow")
+    arrow_series = pd.Series(["foo1", "foo"], dtype="string[pyarrow]")
+    assert series_str_contains(arrow_series, "foo").all()
+    assert series_str_contains(arrow_series, r"\d").tolist() == [True, False]
+    arrow_index = pd.Index(["foo1", "foo2"], dtype=pd.ArrowDtype(pa.string()))
+    assert series_str_contains(arrow_index, r"fo+\d").all()
+
+
 def test_series_str_endswith():
     assert not series_str_endswith(pd.Series(["a", "b", "c"]), "b").all()
     assert series_str_endswith(pd.Series(["ac", "bc", "cc"]), "c").all()
@@ -96,6 +148,80 @@ def test_series_nullable():
     assert not series_nullable(pd.Series([pd.NaT, pd.Timestamp("1939-05-27")]), False).all()
 
 
+def test_series_all_comparisons():
+    assert series_all_greater_equal(pd.Series([1, 2, 3]), 1)
+    assert not series_all_greater_equal(pd.Series([1, 2, 3]), 2)
+    assert series_all_greater(pd.Series([1.0, 2.0]), 0.5)
+    assert not series_all_greater(pd.Series([1.0, np.nan]), 0.5)
+    assert series_all_less_equal(pd.Index([1, 2, 3]), 3)
+    assert series_all_less(pd.Series([1, 2, 3], dtype="uint8"), 4)
+    # undecided for non-numpy or non-numeric data, so the mask is used instead
+    assert not series_all_greater_equal(pd.Series([1, 2, 3], dtype="Int64"), 0)
+    assert not series_all_greater_equal(pd.Series(["a", "b"]), "a")
+
+
+def test_series_all_comparisons_frame():
+    frame = pd.DataFrame(dict(a=[1, 2], b=[3, 4]))
+    assert series_all_greater_equal(frame, 1)
+    assert not series_all_greater(frame, 1)
+    assert series_all_less(frame, 5)
+    # mixed dtypes are left to the per-column path
+    assert not series_all_greater_equal(pd.DataFrame(dict(a=[1, 2], b=[3.0, 4.0])), 0)
+
+
+def test_series_all_comparisons_blocks():
+    values = np.arange(200_000, dtype=float)
+    assert series_all_greater_equal(pd.Series(values), 0)
+    assert not series_all_greater(pd.Series(values), 0)
+    values[-1] = np.nan
+    assert not series_all_greater_equal(pd.Series(values), 0)
+    frame = pd.DataFrame(dict(a=np.ones(100_000), b=np.ones(100_000)))
+    assert series_all_less_equal(frame, 1)
+    frame.iloc[-1, 1] = 2
+    assert not series_all_less_equal(frame, 1)
+
+
+def test_series_all_comparisons_arrow():
+    pytest.importorskip("pyarrow")
+    series = pd.Series([1, 2, None], dtype="int64[pyarrow]")
+    assert series_all_greater_equal(series, 1)
+    assert not series_all_greater_equal(series, 2)
+    assert series_all_less(series, 3)
+    assert not series_all_less(series, 2)
+
+
+def test_series_all_nullable():
+    assert series_all_nullable(pd.Series([1, 2, None]), True)
+    assert series_all_nullable(pd.Series([1, 2, 3]), False)
+    assert not series_all_nullable(pd.Series([1.0, 2.0, np.nan]), False)
+    assert not series_all_nullable(pd.Index([pd.NaT, pd.Timestamp("1939-05-27")]), False)
+
+
+def test_series_unique():
+    assert series_unique(pd.Series([1, 2, 3]), True).all()
+    assert series_unique(pd.Series(["a", "b", "c"]), True).all()
+    assert not series_unique(pd.Series([1, 2, 2]), True).all()
+    assert series_unique(pd.Series([1, 2, 2]), True).tolist() == [True, True, False]
+    assert series_unique(pd.Index([1, 2, 3]), True).all()
+    assert not series_unique(pd.Index([1, 1, 3]), True).all()
+
+
+def test_series_all_unique():
+    assert series_all_unique(pd.Series([1, 2, 3]), True)
+    assert not series_all_unique(pd.Series([1, 2, 2]), True)
+    assert series_all_unique(pd.Index(["a", "b"]), True)
+    assert not series_all_unique(pd.Index(["a", "a"]), True)
+
+
+def test_mask_all():
+    assert mask_all(pd.Series([True, True]))
+    assert not mask_all(pd.Series([True, False]))
+    assert mask_all(np.array([True]))
+    assert not mask_all(pd.Index([False]))
+    assert mask_all(pd.Series([True, pd.NA], dtype="boolean"))
+    assert not mask_all(pd.Series([False, pd.NA], dtype="boolean"))
+
+
 def test_ColumnCheckError():
     check_func = series_greater
     series = pd.Series([1, 2, 3], name="test")
@@ -107,6 +233,23 @@ def test_ColumnCheckError():
         raise ColumnCheckError(check_name=check_func.__name__, check_value=2, series=series, result=result)
 
 
+def test_ColumnCheckError_nullable():
+    series = pd.Series([1, None, -1], dtype="Int64", name="test")
+    error = ColumnCheckError(check_name="series_greater", check_value=0, series=series, result=series > 0)
+    assert str(error).startswith("Column 'test' failed check greater(0): 1 of 3 (33 %)")
+    assert error.fail_series.tolist() == [-1]
+
+
+def test_IndexCheckError():
+    index = pd.Index([1, 2, 3], name="test")
+    error = IndexCheckError(check_name="series_greater", check_value=2, index=index, result=series_greater(index, 2))
+
+    # the message is built once, on first access
+    message = str(error)
+    assert message.startswith("Column 'test' failed check greater(2): 2 of 3 (67 %)")
+    assert str(error) is message
+
+
 if __name__ == "__main__":
     test_series_greater_equal()
     test_series_greater()
@@ -4,6 +4,7 @@ import numpy as np
 import pandas as pd
 
 from pandabear import DataFrameModel, Field, Index
+from pandabear.type_checking import is_of_type
 
 
 def test_datetime():
@@ -55,3 +56,13 @@ def test_categorical_index():
     )
 
     GenericCategorySchema.validate(df)
+
+
+def test_builtin_types():
+    assert is_of_type(pd.Series([1, 2]), int)
+    assert is_of_type(pd.Series([1.0, 2.0]), float)
+    assert is_of_type(pd.Series([True, False]), bool)
+    assert is_of_type(pd.Series(["a", "b"]), str)
+    assert not is_of_type(pd.Series([1, 2], dtype="int32"), int)
+    assert not is_of_type(pd.Series([1, 2], dtype="Int64"), int)
+    assert not is_of_type(pd.Series([1.0, 2.0]), int)
@@ -22,3 +22,20 @@ def test_is_type_index():
 def test_get_index_type():
     assert model_components.get_index_type(model_components.Index[int]) is int
     assert model_components.get_index_type(pd.DatetimeIndex) is pd.DatetimeIndex
+
+
+def test_get_alias_matcher():
+    matches_literal = model_components.get_alias_matcher("spend___")
+    assert matches_literal("spend___google")
+    assert not matches_literal("total_spend___google")
+
+    matches_regex = model_components.get_alias_matcher("spend___.+")
+    assert matches_regex("spend___google")
+    assert not matches_regex("spend___")
+    assert not matches_regex("total_spend___google")
+
+
+def test_match_regex_aliases():
+    names = ("spend___google", "clicks___google", "spend___meta", "days_since")
+    matched = model_components.match_regex_aliases(("spend___.+", "clicks___", "impressions___.+"), names)
+    assert matched == (("spend___google", "spend___meta"), ("clicks___google",), ())
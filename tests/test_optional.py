@@ -14,7 +14,7 @@ The user should be able to provide a field that is optional. For example:
 Should pass without any errors.
 """
 
-from typing import Optional
+from typing import Optional, Union
 
 import pandas as pd
 import pytest
@@ -171,3 +171,11 @@ class TestOptionalFailure:
                     )
                 )
             )
+
+
+def test_check_optional_type():
+    assert DataFrameModel._check_optional_type(Optional[int]) == (int, True)
+    assert DataFrameModel._check_optional_type(int | None) == (int, True)
+    assert DataFrameModel._check_optional_type(int) == (int, False)
+    assert DataFrameModel._check_optional_type(dict[str, None]) == (dict[str, None], False)
+    assert DataFrameModel._check_optional_type(int | str | None) == (Union[int, str], True)
@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+
+from pandabear import DataFrameModel, Field, Index, SeriesModel, check, dataframe_check
+from pandabear.exceptions import ColumnCheckError, SchemaValidationError
+
+
+def test_schema_map_is_cached_per_class():
+    class MySchema(DataFrameModel):
+        column_a: int = Field(ge=0)
+
+    class MyChildSchema(MySchema):
+        column_b: int = Field(lt=0)
+
+    df = pd.DataFrame(dict(column_a=[1, 2]))
+    MySchema.validate(df)
+    MySchema.validate(df)
+
+    schema_map = MySchema.__dict__["__pandabear_schema_map__"]
+    assert list(schema_map) == ["column_a"]
+    assert [check.name for check, _ in schema_map["column_a"].checks] == ["ge"]
+
+    # Subclasses build their own schema map instead of reusing the parent's
+    assert "__pandabear_schema_map__" not in MyChildSchema.__dict__
+    MyChildSchema.validate(pd.DataFrame(dict(column_b=[-1])))
+    assert list(MyChildSchema.__dict__["__pandabear_schema_map__"]) == ["column_b"]
+
+    with pytest.raises(ColumnCheckError):
+        MySchema.validate(pd.DataFrame(dict(column_a=[-1])))
+
+
+def test_schema_map_cache_unaffected_by_index_name():
+    class MySchema(DataFrameModel):
+        index: Index[int] = Field(check_index_name=False)
+        column_a: int
+
+    for index_name in ["first", "second"]:
+        df = pd.DataFrame(dict(column_a=[1, 2]), index=pd.Index([0, 1], name=index_name))
+        MySchema.validate(df)
+        assert list(MySchema.__dict__["__pandabear_schema_map__"]) == ["index", "column_a"]
+
+
+def test_field_checks_run_cheapest_first():
+    class MySchema(DataFrameModel):
+        column_a: str = Field(unique=True, str_contains="a", isin=["a", "ab"], nullable=False)
+
+    checks = MySchema._get_schema_map()["column_a"].checks
+    assert [check.name for check, _ in checks] == ["nullable", "isin", "str_contains", "unique"]
+
+
+def test_config_is_cached_per_class():
+    class MySchema(DataFrameModel):
+        column_a: int
+
+        class Config:
+            coerce = True
+
+    df = pd.DataFrame(dict(column_a=[1.0, 2.0]))
+    MySchema.validate(df)
+    config = MySchema.Config
+    MySchema.validate(df)
+    assert MySchema.Config is config
+    assert config.coerce and config.strict
+
+    # Replacing `Config` is picked up by the next validation
+    class StrictConfig:
+        coerce = False
+
+    MySchema.Config = StrictConfig
+    with pytest.raises(SchemaValidationError):
+        MySchema.validate(df)
+    assert not MySchema.Config.coerce
+
+
+def test_custom_checks_are_collected_once():
+    class MySchema(DataFrameModel):
+        column_a: int
+
+        @check("column_a")
+        def check_positive(column: pd.Series) -> bool:
+            return (column > 0).all()
+
+        @dataframe_check
+        def check_not_empty(df: pd.DataFrame) -> bool:
+            return len(df) > 0
+
+    MySchema.validate(pd.DataFrame(dict(column_a=[1, 2])))
+    custom_checks = MySchema.__dict__["__pandabear_custom_checks__"]
+    assert [(attr_name, check_columns) for attr_name, _, check_columns in custom_checks] == [
+        ("check_not_empty", None),
+        ("check_positive", ("column_a",)),
+    ]
+
+    with pytest.raises(ValueError, match="check_positive"):
+        MySchema.validate(pd.DataFrame(dict(column_a=[-1])))
+    assert MySchema.__dict__["__pandabear_custom_checks__"] is custom_checks
+
+
+def test_series_model_value_info_is_cached():
+    class MySeries(SeriesModel):
+        value: int = Field(gt=0)
+
+    MySeries.validate(pd.Series([1, 2]))
+    value_type, checks = MySeries.__dict__["__pandabear_value_info__"]
+    assert value_type is int
+    assert [check.name for check, _ in checks] == ["gt"]
+
+    with pytest.raises(ColumnCheckError):
+        MySeries.validate(pd.Series([0, 1]))
@@ -1,7 +1,11 @@
 import pandas as pd
 import pytest
 
-from pandabear.exceptions import MissingColumnsError, SchemaValidationError
+from pandabear.exceptions import (
+    ColumnCheckError,
+    MissingColumnsError,
+    SchemaValidationError,
+)
 from pandabear.model import DataFrameModel, SeriesModel
 from pandabear.model_components import Field
 
@@ -23,6 +27,7 @@ def test_strict_filter_ordered_columns():
     dfval = MySchema._validate_columns(df)
     assert dfval.shape == (1, 3)
     assert dfval.columns.tolist() == ["a", "b", "c"]
+    assert "d" in df.columns
 
     # 2. column order is maintained
     df = pd.DataFrame(dict(b=[1.0], a=[1], d=[1], c=["a"]))
@@ -80,3 +85,92 @@ def test_strict_filter_ordered_columns():
     df = pd.DataFrame(dict(b=[1.0], a=[1]))
     with pytest.raises(MissingColumnsError):
         dfval = MySchema._validate_columns(df)
+
+
+def test_regex_columns_checked_together():
+    class MySchema(DataFrameModel):
+        spend: float = Field(alias="spend___.+", regex=True, ge=0, lt=100)
+
+    df = pd.DataFrame(dict(spend___google=[1.0, 2.0], spend___meta=[3.0, 4.0]))
+    MySchema.validate(df)
+
+    df = pd.DataFrame(dict(spend___google=[1.0, 2.0], spend___meta=[3.0, -4.0]))
+    with pytest.raises(ColumnCheckError, match="Column 'spend___meta' failed check ge"):
+        MySchema.validate(df)
+
+    df = pd.DataFrame(dict(spend___google=[1.0, 2.0], spend___meta=[3, 4]))
+    with pytest.raises(SchemaValidationError):
+        MySchema.validate(df)
+
+
+@pytest.mark.parametrize("filter", [False, True])
+def test_validate_does_not_modify_input(filter):
+    class MySchema(DataFrameModel):
+        a: float = Field()
+
+        class Config:
+            coerce = True
+            strict = False
+
+    MySchema.Config.filter = filter
+
+    df = pd.DataFrame(dict(a=[1, 2], b=[3, 4]))
+    dfval = MySchema.validate(df)
+    assert dfval is not df
+    assert dfval["a"].dtype == float
+    assert df["a"].dtype == int
+    assert df.columns.tolist() == ["a", "b"]
+
+
+def test_missing_columns_reported_together():
+    class MySchema(DataFrameModel):
+        a: int = Field()
+        b: int = Field(alias="bb")
+        c: int = Field()
+        d: int = Field(alias="d_.+", regex=True)
+
+    df = pd.DataFrame(dict(c=[1]))
+    with pytest.raises(MissingColumnsError) as excinfo:
+        MySchema.validate(df)
+    assert str(excinfo.value).startswith(
+        "No columns match column name `a`, alias `bb` for field `b`, regex `d_.+` for field `d` in schema `MySchema`."
+    )
+
+    df = pd.DataFrame(dict(a=[1], bb=[1], d_1=[1]))
+    with pytest.raises(MissingColumnsError, match="No columns match column name `c` in schema `MySchema`"):
+        MySchema.validate(df)
+
+
+def test_validate_result_does_not_share_data_with_input():
+    class MySchema(DataFrameModel):
+        a: float = Field()
+        b: int = Field()
+
+        class Config:
+            coerce = True
+
+    df = pd.DataFrame(dict(a=[1.0, 2.0], b=[1.5, 2.5]))
+    dfval = MySchema.validate(df)
+    assert dfval["b"].tolist() == [1, 2]
+
+    # Writing to the result must not change the input, also for columns that
+    # already had the right type
+    dfval.loc[0, "a"] = 100.0
+    assert df["a"].tolist() == [1.0, 2.0]
+    assert df["b"].tolist() == [1.5, 2.5]
+
+
+def test_large_regex_column_group_checked_per_column():
+    class MySchema(DataFrameModel):
+        spend: float = Field(alias="spend___.+", regex=True, ge=0)
+
+    columns = ["spend___google", "spend___meta"]
+    df = pd.DataFrame({col: [1.0] * 40_000 for col in columns})
+
+    # Too large to gather into one frame, so the columns are checked one by one
+    assert not MySchema._columns_pass_checks(df, columns, MySchema._get_cached_schema_map()["spend"].checks, float)
+    MySchema.validate(df)
+
+    df.loc[39_999, "spend___meta"] = -1.0
+    with pytest.raises(ColumnCheckError, match="Column 'spend___meta' failed check ge"):
+        MySchema.validate(df)
@@ -1,7 +1,12 @@
 import pandas as pd
 import pytest
 
-from pandabear.exceptions import MissingIndexError, SchemaValidationError
+from pandabear.exceptions import (
+    ColumnCheckError,
+    IndexCheckError,
+    MissingIndexError,
+    SchemaValidationError,
+)
 from pandabear.model import DataFrameModel
 from pandabear.model_components import Field, Index
 
@@ -247,3 +252,102 @@ def test_multiindex_check_index_name__failing():
     # 1. fails
     with pytest.raises(MissingIndexError):
         Coefficients.validate(df)
+
+
+def test_index_field_checks():
+    class MySchema(DataFrameModel):
+        index: Index[int] = Field(ge=0, unique=True)
+        a: int = Field(ge=0)
+
+    MySchema.validate(pd.DataFrame(dict(a=[1, 2]), index=pd.Index([0, 1], name="index")))
+
+    with pytest.raises(IndexCheckError, match="Column 'index' failed check ge"):
+        MySchema.validate(pd.DataFrame(dict(a=[1, 2]), index=pd.Index([-1, 1], name="index")))
+    with pytest.raises(ColumnCheckError):
+        MySchema.validate(pd.DataFrame(dict(a=[-1, 2]), index=pd.Index([0, 1], name="index")))
+
+
+def test_multiindex_level_coerced():
+    class MySchema(DataFrameModel):
+        ix0: Index[float] = Field(coerce=True)
+        ix1: Index[str] = Field()
+        ix2: Index[float] = Field(coerce=True)
+        a: int = Field()
+
+    index = pd.MultiIndex.from_arrays([[1, 2, 3], ["x", "y", "z"], [4, 5, 6]], names=["ix0", "ix1", "ix2"])
+    df = pd.DataFrame(dict(a=[1, 2, 3]), index=index)
+    dfval = MySchema.validate(df)
+
+    assert dfval.index.names == ["ix0", "ix1", "ix2"]
+    assert dfval.index.get_level_values("ix0").dtype == float
+    assert dfval.index.get_level_values("ix1").tolist() == ["x", "y", "z"]
+    assert dfval.index.get_level_values("ix2").tolist() == [4.0, 5.0, 6.0]
+    assert dfval.index.get_level_values("ix2").dtype == float
+    assert df.index.get_level_values("ix0").dtype == int
+
+    with pytest.raises(ValueError, match="Index level 'ix3' not found in MultiIndex"):
+        MySchema._override_levels(index, {"ix3": [1.0, 2.0, 3.0]})
+
+
+def test_filter_drops_all_index_levels():
+    class MySchema(DataFrameModel):
+        a: int = Field()
+
+        class Config:
+            filter = True
+
+    df = pd.DataFrame(dict(a=[1, 2]), index=pd.Index(["x", "y"], name="ix"))
+    dfval = MySchema.validate(df)
+
+    assert dfval.index.equals(pd.RangeIndex(2))
+    assert dfval.index.names == [None]
+    assert df.index.tolist() == ["x", "y"]
+
+
+def test_sorted_multiindex_unique():
+    class MySchema(DataFrameModel):
+        ix0: Index[int] = Field()
+        ix1: Index[int] = Field()
+        a: int = Field()
+
+        class Config:
+            multiindex_sorted = True
+            multiindex_unique = True
+
+    index = pd.MultiIndex.from_arrays([[1, 1, 2], [1, 2, 2]], names=["ix0", "ix1"])
+    MySchema.validate(pd.DataFrame(dict(a=[1, 2, 3]), index=index))
+
+    index = pd.MultiIndex.from_arrays([[2, 1, 1], [2, 2, 2]], names=["ix0", "ix1"])
+    with pytest.raises(SchemaValidationError, match="MultiIndex is not unique"):
+        MySchema.validate(pd.DataFrame(dict(a=[1, 2, 3]), index=index))
+
+
+def test_range_index_coerced():
+    class MySchema(DataFrameModel):
+        index: Index[str] = Field(coerce=True)
+        a: int = Field()
+
+    df = pd.DataFrame(dict(a=[1, 2, 3]), index=pd.RangeIndex(3, name="index"))
+    dfval = MySchema.validate(df)
+
+    assert type(dfval.index) is pd.Index
+    assert dfval.index.tolist() == ["0", "1", "2"]
+    assert isinstance(df.index, pd.RangeIndex)
+
+
+def test_filter_dropped_level_does_not_share_data():
+    class MySchema(DataFrameModel):
+        ix0: Index[int] = Field()
+        a: float = Field()
+
+        class Config:
+            filter = True
+
+    index = pd.MultiIndex.from_arrays([[1, 2], [3, 4]], names=["ix0", "ix1"])
+    df = pd.DataFrame(dict(a=[1.0, 2.0]), index=index)
+    dfval = MySchema.validate(df)
+
+    assert dfval.index.names == ["ix0"]
+    dfval.loc[1, "a"] = 100.0
+    assert df["a"].tolist() == [1.0, 2.0]
+    assert df.index.names == ["ix0", "ix1"]
@@ -123,6 +123,22 @@ class TestCoerceSuccess:
 
         assert df_out["column_a"].dtype == "object"
 
+    def test___coerce__columns__success(self):
+        class MySchema(DataFrameModel):
+            column_a: int = Field(ge=0)
+            column_b: float = Field(alias="column_b_.+", regex=True)
+            column_c: str = Field()
+
+            class Config:
+                coerce = True
+
+        df = pd.DataFrame(dict(column_a=["4", "5"], column_b_1=[1, 2], column_b_2=[3.0, 4.0], column_c=["x", "y"]))
+
+        df_out = MySchema.validate(df)
+
+        assert df_out.dtypes.tolist() == [int, float, float, object]
+        assert df["column_a"].dtype == object
+
 
 class TestCoerceFailure:
     def test___coerce__index__failure(self):
@@ -149,3 +165,16 @@ class TestCoerceFailure:
 
         with pytest.raises(CoersionError):
             MySchema.validate(df)
+
+    def test___coerce__columns__failure(self):
+        class MySchema(DataFrameModel):
+            column_a: int = Field()
+            column_b: int = Field()
+
+            class Config:
+                coerce = True
+
+        df = pd.DataFrame(dict(column_a=["4", "5"], column_b=["a", "b"]))
+
+        with pytest.raises(CoersionError, match="column_b"):
+            MySchema.validate(df)